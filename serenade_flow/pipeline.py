@@ -3,17 +3,18 @@
 
 Extract, Load, and Transform data from local or remote data sources.
 """
-from concurrent.futures import ThreadPoolExecutor
 import logging
+import os
 
 import pandas as pd
 
 # Pipeline Configuration
 CONFIG = {}
 
-# Configure Loggiing
+# Configure Logging, overridable via SERENADE_LOG_LEVEL (e.g. DEBUG, WARNING)
 logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)-15s %(levelname)-8s %(message)s"
+    level=os.environ.get("SERENADE_LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)-15s %(levelname)-8s %(message)s",
 )
 
 # Initialize Logging
@@ -52,16 +53,12 @@ def extract_remote_data():
 
 def extract() -> pd.DataFrame:
     """Extract."""
-    data_future = None
     data_payload = None
 
-    with ThreadPoolExecutor() as executor:
-        if CONFIG["data_source"] == "local":
-            data_future = executor.submit(extract_local_data)
-        elif CONFIG["data_source"] == "remote":
-            data_future = executor.submit(extract_remote_data)
-
-        data_payload = data_future.result()
+    if CONFIG["data_source"] == "local":
+        data_payload = extract_local_data()
+    elif CONFIG["data_source"] == "remote":
+        data_payload = extract_remote_data()
 
     return data_payload
 